@@ -12,7 +12,7 @@ echo ""
 echo "[1/5] Checking Python version..."
 if ! command -v python3 &> /dev/null; then
     echo "❌ Error: Python 3 is not installed"
-    echo "Please install Python 3.8 or higher"
+    echo "Please install Python 3.10 or higher"
     exit 1
 fi
 
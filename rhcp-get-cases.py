@@ -4,16 +4,22 @@ Red Hat Cases TUI Monitor
 A terminal user interface for monitoring Red Hat support cases
 """
 
+import os
 import sys
 import time
 import json
+import atexit
+import hashlib
 import subprocess
 import threading
 import select
+import termios
+import tty
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional
-from dataclasses import dataclass
+from typing import List, Dict, Optional, Tuple
+from dataclasses import dataclass, field, fields
 
 from rich.console import Console, Group
 from rich.table import Table
@@ -26,9 +32,37 @@ from rich import box
 from datetime import datetime, timezone, timedelta
 import yaml
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
-@dataclass
+# orjson is optional; it parses large case lists faster than the stdlib
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Color code severity
+_SEVERITY_STYLE = {
+    "1 (Urgent)": "bold red",
+    "2 (High)": "red",
+    "3 (Normal)": "yellow",
+    "4 (Low)": "green"
+}
+
+# Color code status; anything else is waiting on the customer
+_STATUS_STYLE = {
+    "Waiting on Red Hat": "bold red"
+}
+
+
+@dataclass(slots=True, frozen=True)
 class Case:
     """Represents a Red Hat support case"""
     case_number: str
@@ -38,22 +72,43 @@ class Case:
     product: str
     created: str
     last_modified: str
+    # Derived once from case_number; frozen, so set through object.__setattr__
+    case_url: str = field(init=False, repr=False)
+    # Rich markup for the case number cell
+    case_link: str = field(init=False, repr=False)
+    # (valid until, table row) memoized by CaseMonitorTUI.render_case_row;
+    # None means the row never changes
+    _rendered: Optional[Tuple[Optional[datetime], Tuple[str, ...]]] = field(init=False, default=None, repr=False, compare=False)
     
-    @property
-    def case_url(self) -> str:
-        return f"https://access.redhat.com/support/cases/#/case/{self.case_number}"
+    def __post_init__(self):
+        case_url = f"https://access.redhat.com/support/cases/#/case/{self.case_number}"
+        object.__setattr__(self, "case_url", case_url)
+        object.__setattr__(self, "case_link", f"[link={case_url}]{self.case_number}[/link]")
 
 
-@dataclass
+@dataclass(slots=True)
 class Account:
     """Represents a Red Hat account"""
     id: str
     name: str
     cases: list[Case] | None = None 
+    # Counts kept in step with cases so the summary doesn't rescan them
+    total_cases: int = field(init=False, default=0)
+    waiting_on_rh: int = field(init=False, default=0)
     
     def __post_init__(self):
-        if self.cases is None:
-            self.cases = []
+        self.set_cases(self.cases or [])
+    
+    def set_cases(self, cases: list[Case]):
+        """Install a new case list and recount it in a single pass"""
+        total = waiting_on_rh = 0
+        for case in cases:
+            total += 1
+            if case.status == "Waiting on Red Hat":
+                waiting_on_rh += 1
+        self.cases = cases
+        self.total_cases = total
+        self.waiting_on_rh = waiting_on_rh
 
 
 class RedHatAPI:
@@ -62,24 +117,89 @@ class RedHatAPI:
     TOKEN_ENDPOINT = "https://sso.redhat.com/auth/realms/redhat-external/protocol/openid-connect/token"
     CASES_ENDPOINT = "https://api.access.redhat.com/support/v1/cases/filter"
     CLIENT_ID = "rhsm-api"
+    # Shared by every filter request rather than rebuilt per call
+    STATUSES = ("Waiting on Customer", "Waiting on Red Hat")
+    # (connect, read) seconds; a hung request would otherwise pin a worker forever
+    REQUEST_TIMEOUT = (10, 30)
+    # Token refreshes hold _token_lock and so stall every fetch worker;
+    # the SSO exchange is small, so give up on it sooner
+    TOKEN_TIMEOUT = (10, 10)
+    # A trusted batch is checked against per-account requests again after
+    # this many refreshes, in case it starts coming back truncated
+    BATCH_REVERIFY_EVERY = 4
+    TOKEN_CACHE_FILE = Path("~/.cache/rhcp-token.json").expanduser()
+    CASES_CACHE_FILE = Path("~/.cache/rhcp-cases.json").expanduser()
     
-    def __init__(self, offline_token: str):
+    def __init__(self, offline_token: str, cache_ttl: float = 0):
         self.offline_token = offline_token
         self.access_token: Optional[str] = None
         self.token_expiry: Optional[datetime] = None
+        # Serializes token refreshes when accounts are fetched concurrently
+        self._token_lock = threading.Lock()
+        self._token_key = hashlib.sha256(offline_token.encode()).hexdigest()
+        
+        # Reuse keep-alive connections to SSO and the API across refreshes
+        self.session = requests.Session()
+        # Retry failed connects and gateway errors only; a read timeout on a
+        # POST is not retried, so a stalled request costs one REQUEST_TIMEOUT
+        retries = Retry(
+            total=3,
+            connect=3,
+            read=0,
+            status=3,
+            backoff_factor=0.3,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=frozenset({"POST"})
+        )
+        self.session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retries))
+        self.session.headers.update({"Content-Type": "application/json"})
+        
+        self._load_cached_token()
+        
+        # account_number -> (fetch time, cases); served while younger than
+        # cache_ttl and as a fallback when the API is unreachable
+        self.cache_ttl = cache_ttl
+        self._cache: Dict[str, Tuple[float, List[Case]]] = {}
+        # account_number -> error for accounts currently served from a stale entry
+        self.stale: Dict[str, str] = {}
+        # account_number -> (ETag, Last-Modified, body hash) of the response
+        # behind the cached entry, for conditional requests
+        self._validators: Dict[str, Tuple[Optional[str], Optional[str], str]] = {}
+        # Whether the filter endpoint honors a list of accounts: None until a
+        # batch response has been checked against per-account results
+        self.batch_supported: Optional[bool] = None
+        self._batches_since_verify = 0
+        self._load_cached_cases()
+        atexit.register(self._save_cached_cases)
+    
+    def close(self):
+        """Close the underlying HTTP session"""
+        self.session.close()
+    
+    def __del__(self):
+        session = getattr(self, "session", None)
+        if session is not None:
+            session.close()
     
     def get_access_token(self) -> str:
         """Obtain or refresh the access token"""
-        if self.access_token and self.token_expiry and datetime.now() < self.token_expiry:
-            return self.access_token
-        
-        response = requests.post(
+        with self._token_lock:
+            if self.access_token and self.token_expiry and datetime.now() < self.token_expiry:
+                return self.access_token
+            return self._refresh_access_token()
+    
+    def _refresh_access_token(self) -> str:
+        """Exchange the offline token for a new access token"""
+        # Form-encoded body without the stale bearer token from the session
+        response = self.session.post(
             self.TOKEN_ENDPOINT,
             data={
                 "grant_type": "refresh_token",
                 "refresh_token": self.offline_token,
                 "client_id": self.CLIENT_ID
-            }
+            },
+            headers={"Content-Type": "application/x-www-form-urlencoded", "Authorization": None},
+            timeout=self.TOKEN_TIMEOUT
         )
         
         if response.status_code != 200:
@@ -91,100 +211,327 @@ class RedHatAPI:
         if not self.access_token:
             raise Exception("No access token in response")
         
+        self.session.headers["Authorization"] = f"Bearer {self.access_token}"
+        
         # Token typically expires in 5 minutes, refresh before that
         expires_in = data.get("expires_in", 300)
-        self.token_expiry = datetime.now()
+        self.token_expiry = datetime.now() + timedelta(seconds=max(30, expires_in - 30))
+        self._save_cached_token()
         
         return self.access_token
     
-    def fetch_cases(self, account_number: str) -> List[Case]:
-        """Fetch cases for a specific account"""
-        token = self.get_access_token()
+    def _load_cached_token(self):
+        """Reuse a still-valid access token persisted by a previous run"""
+        try:
+            with open(self.TOKEN_CACHE_FILE, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        
+        # Anything unexpected in the file just means no cached token
+        if not isinstance(data, dict) or data.get("key") != self._token_key:
+            return
+        
+        access_token = data.get("access_token")
+        expires_at = data.get("expires_at")
+        if not access_token or not isinstance(access_token, str):
+            return
+        if not isinstance(expires_at, (int, float)) or isinstance(expires_at, bool):
+            return
         
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json"
-        }
+        try:
+            expiry = datetime.fromtimestamp(expires_at)
+        except (OverflowError, OSError, ValueError):
+            return
+        
+        if datetime.now() < expiry:
+            self.access_token = data["access_token"]
+            self.token_expiry = expiry
+            self.session.headers["Authorization"] = f"Bearer {self.access_token}"
+    
+    def _save_cached_token(self):
+        """Persist the access token so restarts can skip the SSO call"""
+        self._write_private_json(self.TOKEN_CACHE_FILE, {
+            "key": self._token_key,
+            "access_token": self.access_token,
+            "expires_at": self.token_expiry.timestamp()
+        })
+    
+    @staticmethod
+    def _write_private_json(path: Path, data: dict):
+        """Write a cache file readable only by the current user"""
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            # O_CREAT's mode doesn't apply to an existing file
+            os.fchmod(fd, 0o600)
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f)
+        except OSError:
+            # Caching is best effort; everything is still held in memory
+            pass
+    
+    def _load_cached_cases(self):
+        """Warm the response cache from a previous run"""
+        try:
+            with open(self.CASES_CACHE_FILE, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        
+        if not isinstance(data, dict) or data.get("key") != self._token_key:
+            return
         
-        payload = {
-            "accountNumber": account_number,
-            "statuses": ["Waiting on Customer", "Waiting on Red Hat"]
+        try:
+            for account_number, entry in data.get("accounts", {}).items():
+                fetched_at = entry["fetched_at"]
+                if not isinstance(fetched_at, (int, float)) or isinstance(fetched_at, bool):
+                    raise TypeError("fetched_at is not a timestamp")
+                cases = []
+                for case_data in entry["cases"]:
+                    if not all(isinstance(value, str) for value in case_data.values()):
+                        raise TypeError("case fields must be strings")
+                    cases.append(Case(**case_data))
+                self._cache[account_number] = (fetched_at, cases)
+        except (AttributeError, KeyError, TypeError):
+            # Corrupt or written by an incompatible version; start cold
+            self._cache.clear()
+    
+    def _save_cached_cases(self):
+        """Persist the response cache for the next run"""
+        names = [f.name for f in fields(Case) if f.init]
+        accounts = {
+            account_number: {
+                "fetched_at": fetched_at,
+                "cases": [{name: getattr(case, name) for name in names} for case in cases]
+            }
+            for account_number, (fetched_at, cases) in dict(self._cache).items()
         }
+        self._write_private_json(self.CASES_CACHE_FILE, {"key": self._token_key, "accounts": accounts})
+    
+    def _fresh_cases(self, account_number: str) -> Optional[List[Case]]:
+        """Return cached cases younger than cache_ttl, if any"""
+        cached = self._cache.get(account_number)
+        if cached and time.time() - cached[0] < self.cache_ttl:
+            self.stale.pop(account_number, None)
+            return cached[1]
+        return None
+    
+    def _store_cases(self, account_number: str, cases: List[Case]):
+        """Record freshly fetched cases in the response cache"""
+        self._cache[account_number] = (time.time(), cases)
+        self.stale.pop(account_number, None)
+    
+    def fetched_at(self, account_number: str) -> Optional[float]:
+        """Return when the cached cases for an account were fetched, if cached"""
+        cached = self._cache.get(account_number)
+        return cached[0] if cached else None
+    
+    def fetch_cases(self, account_number: str) -> List[Case]:
+        """Fetch cases for a specific account, using the response cache"""
+        cases = self._fresh_cases(account_number)
+        if cases is not None:
+            return cases
         
-        response = requests.post(
-            self.CASES_ENDPOINT,
-            headers=headers,
-            json=payload
-        )
+        try:
+            cases = self._request_cases(account_number)
+        except Exception as e:
+            cached = self._cache.get(account_number)
+            if cached is None:
+                raise
+            self.stale[account_number] = str(e)
+            return cached[1]
         
+        self._store_cases(account_number, cases)
+        return cases
+    
+    def fetch_cases_batch(self, account_numbers: List[str]) -> Dict[str, List[Case]]:
+        """Fetch cases for several accounts with a single filter request
+        
+        Until verify_batch() has confirmed batching, the results are
+        returned without being cached.
+        """
+        results = {}
+        pending = []
+        for account_number in account_numbers:
+            cases = self._fresh_cases(account_number)
+            if cases is None:
+                pending.append(account_number)
+            else:
+                results[account_number] = cases
+        
+        if not pending:
+            return results
+        
+        # One request across all accounts is the likeliest to hit the
+        # endpoint's result cap, so periodically stop trusting it
+        if self.batch_supported:
+            self._batches_since_verify += 1
+            if self._batches_since_verify > self.BATCH_REVERIFY_EVERY:
+                self.batch_supported = None
+        
+        # Network errors and 5xx fall back for this refresh only;
+        # _request_cases_batch disables batching when it is rejected
+        grouped = self._request_cases_batch(pending)
+        
+        for account_number, cases in grouped.items():
+            if self.batch_supported:
+                # Validators from single-account responses no longer describe the cache
+                self._validators.pop(account_number, None)
+                self._store_cases(account_number, cases)
+            results[account_number] = cases
+        
+        return results
+    
+    def verify_batch(self, batch: Dict[str, List[Case]], per_account: Dict[str, List[Case]]):
+        """Trust batching only if it matched the per-account results"""
+        # Entries served from the cache on both paths are the same list
+        # object and say nothing about the batch request
+        compared = [n for n in batch if n in per_account and batch[n] is not per_account[n]]
+        if not compared:
+            return
+        self._batches_since_verify = 0
+        self.batch_supported = all(
+            sorted(c.case_number for c in batch[n]) == sorted(c.case_number for c in per_account[n])
+            for n in compared
+        )
+    
+    def _request_cases_batch(self, account_numbers: List[str]) -> Dict[str, List[Case]]:
+        """Fetch cases for several accounts from the API, grouped by account"""
+        response = self._post_filter({"accountNumbers": account_numbers})
+        
+        # A client error means the endpoint doesn't take this filter; auth,
+        # timeout and rate-limit statuses say nothing about batching
+        if 400 <= response.status_code < 500 and response.status_code not in (401, 408, 429):
+            self.batch_supported = False
         if response.status_code != 200:
             raise Exception(f"Failed to fetch cases: {response.text}")
         
-        data = response.json()
-        cases = []
+        data = _json_loads(response.content)
+        grouped: Dict[str, List[Case]] = {account_number: [] for account_number in account_numbers}
         
         for case_data in data.get("cases", []):
-            cases.append(Case(
-                case_number=case_data.get("caseNumber", ""),
-                summary=case_data.get("summary", "")[:100],
-                severity=case_data.get("severity", ""),
-                status=case_data.get("status", ""),
-                product=case_data.get("product", ""),
-                created=case_data.get("createdDate", ""),
-                last_modified=case_data.get("lastModifiedDate", "")
-            ))
+            # Cases must say which account they belong to for the split to work
+            account_number = case_data.get("accountNumber")
+            if account_number is None:
+                self.batch_supported = False
+                raise Exception("Batch response does not include account numbers")
+            if account_number in grouped:
+                grouped[account_number].append(self._parse_case(case_data))
+        
+        return grouped
+    
+    def _post_filter(self, filters: dict, headers: Optional[dict] = None) -> requests.Response:
+        """POST an account filter to the cases endpoint"""
+        self.get_access_token()
         
-        return cases
+        return self.session.post(
+            self.CASES_ENDPOINT,
+            json={**filters, "statuses": self.STATUSES},
+            headers=headers,
+            timeout=self.REQUEST_TIMEOUT
+        )
+    
+    def _request_cases(self, account_number: str) -> List[Case]:
+        """Fetch cases for a specific account from the API"""
+        cached = self._cache.get(account_number)
+        validators = self._validators.get(account_number) if cached else None
+        
+        headers = {}
+        if validators:
+            etag, last_modified, _ = validators
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+        
+        response = self._post_filter({"accountNumber": account_number}, headers)
+        
+        if response.status_code == 304 and cached:
+            return cached[1]
+        if response.status_code != 200:
+            raise Exception(f"Failed to fetch cases: {response.text}")
+        
+        # Without server-side validators, an identical body still means
+        # nothing changed; handing back the cached list skips the parse
+        # and lets the TUI keep its existing table
+        body_hash = hashlib.sha256(response.content).hexdigest()
+        if validators and validators[2] == body_hash:
+            return cached[1]
+        
+        self._validators[account_number] = (
+            response.headers.get("ETag"),
+            response.headers.get("Last-Modified"),
+            body_hash
+        )
+        data = _json_loads(response.content)
+        return [self._parse_case(case_data) for case_data in data.get("cases", [])]
+    
+    @staticmethod
+    def _parse_case(case_data: dict) -> Case:
+        """Build a Case from one entry of the API response"""
+        return Case(
+            case_number=case_data.get("caseNumber", ""),
+            summary=case_data.get("summary") or "",
+            severity=case_data.get("severity", ""),
+            status=case_data.get("status", ""),
+            product=case_data.get("product", ""),
+            created=case_data.get("createdDate", ""),
+            last_modified=case_data.get("lastModifiedDate", "")
+        )
+
+
+class LiveHeader:
+    """Renders the app header afresh on every Live redraw"""
+    
+    def __init__(self, app: "CaseMonitorTUI"):
+        self.app = app
+    
+    def __rich__(self) -> Panel:
+        return self.app.create_header()
 
 
 class CaseMonitorTUI:
     """Main TUI application"""
     
+    # Seconds between redraws of the "next refresh" countdown
+    COUNTDOWN_TICK = 10
+    
     def __init__(self, accounts_file: str, offline_token: str, refresh_minutes: int = 15):
         self.accounts_file = Path(accounts_file)
-        self.api = RedHatAPI(offline_token)
         self.refresh_seconds = refresh_minutes * 60
+        self.api = RedHatAPI(offline_token, cache_ttl=self.refresh_seconds)
         self.console = Console()
         self.accounts: List[Account] = []
         self.last_update: Optional[datetime] = None
         self.running = True
         self.error_message: Optional[str] = None
         self.key_pressed = None
+        # Set by the keyboard listener so run() stops waiting immediately
+        self._wake = threading.Event()
+        self.next_refresh: Optional[float] = None
+        self.executor: Optional[ThreadPoolExecutor] = None
+        self.layout: Optional[Layout] = None
+        self._summary_totals: Optional[Tuple[int, int]] = None
+        # account id -> (case list, table, when a row's color next changes)
+        self._account_tables: Dict[str, Tuple[List[Case], Table, Optional[datetime]]] = {}
         
     def keyboard_listener(self):
-            """Dedicated thread to catch the 'q' key"""
-            import tty
-            import termios
-            import sys
-            fd = sys.stdin.fileno()
-            old_settings = termios.tcgetattr(fd)
-            try:
-                tty.setcbreak(fd)
-                while self.running:
-                    # This will block until a key is pressed
-                    char = sys.stdin.read(1)
-                    if char.lower() == 'q':
-                        self.running = False
-                        break
-            finally:
-                termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
-            """Check for keyboard input in a non-blocking way"""
-            import sys
-            import tty
-            import termios
-            
-            # Save terminal settings
-            old_settings = termios.tcgetattr(sys.stdin)
-            try:
-                tty.setcbreak(sys.stdin.fileno())
-                # Check if input is available
-                if select.select([sys.stdin], [], [], 0)[0]:
-                    char = sys.stdin.read(1)
-                    if char.lower() == 'q':
-                        self.running = False
-            finally:
-                # Restore terminal settings
-                termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
+        """Dedicated thread to catch the 'q' key"""
+        fd = sys.stdin.fileno()
+        old_settings = termios.tcgetattr(fd)
+        try:
+            tty.setcbreak(fd)
+            while self.running:
+                # Poll so the thread notices self.running going False
+                # instead of blocking in read() until the next key press
+                readable, _, _ = select.select([fd], [], [], 0.5)
+                if readable and os.read(fd, 1).lower() == b'q':
+                    self.running = False
+                    self._wake.set()
+                    break
+        finally:
+            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
     
     def load_accounts(self) -> List[Account]:
         """Load accounts from YAML file"""
@@ -192,7 +539,7 @@ class CaseMonitorTUI:
             raise FileNotFoundError(f"Accounts file not found: {self.accounts_file}")
         
         with open(self.accounts_file, 'r') as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_YamlLoader)
         
         accounts = []
         for acc_data in data.get('accounts', []):
@@ -206,18 +553,65 @@ class CaseMonitorTUI:
     def fetch_all_cases(self):
         """Fetch cases for all accounts"""
         self.error_message = None
+        errors = []
         try:
-            for account in self.accounts:
+            batch = None
+            if self.api.batch_supported is not False and len(self.accounts) > 1:
+                try:
+                    batch = self.api.fetch_cases_batch([account.id for account in self.accounts])
+                except Exception:
+                    # Fall back to one request per account below, which also
+                    # serves stale cache entries and reports per-account errors
+                    pass
+                else:
+                    # Unverified batches (the first, then every
+                    # BATCH_REVERIFY_EVERY refreshes) are checked against the
+                    # per-account requests below, costing N+1 requests
+                    if self.api.batch_supported:
+                        for account in self.accounts:
+                            account.set_cases(batch[account.id])
+                        self.update_last_update()
+                        return
+            
+            # Per-account results, to check an unverified batch against
+            fetched = {}
+            if self.executor is None:
+                # The API calls are I/O bound, so fetch accounts in parallel
+                self.executor = ThreadPoolExecutor(max_workers=max(1, min(8, len(self.accounts))))
+            
+            futures = {
+                self.executor.submit(self.api.fetch_cases, account.id): account
+                for account in self.accounts
+            }
+            for future in as_completed(futures):
+                account = futures[future]
                 try:
-                    account.cases = self.api.fetch_cases(account.id)
+                    account.set_cases(future.result())
+                    if account.id in self.api.stale:
+                        errors.append(f"Showing cached cases for {account.name}: {self.api.stale[account.id]}")
+                    else:
+                        fetched[account.id] = account.cases
                 except Exception as e:
-                    self.error_message = f"Error fetching cases for {account.name}: {str(e)}"
-                    account.cases = []
+                    errors.append(f"Error fetching cases for {account.name}: {str(e)}")
+                    account.set_cases([])
             
-            self.last_update = datetime.now()
+            if batch is not None:
+                self.api.verify_batch(batch, fetched)
+            
+            if errors:
+                self.error_message = "; ".join(errors)
+            self.update_last_update()
         except Exception as e:
             self.error_message = f"Error: {str(e)}"
     
+    def update_last_update(self):
+        """Date the display by the oldest case data it is showing"""
+        # Cache hits and stale fallbacks show older data than this refresh
+        fetch_times = [self.api.fetched_at(account.id) for account in self.accounts]
+        fetch_times = [t for t in fetch_times if t is not None]
+        if fetch_times:
+            self.last_update = datetime.fromtimestamp(min(fetch_times))
+    
     def create_header(self) -> Panel:
         """Create the header panel"""
         header_text = Text()
@@ -227,7 +621,10 @@ class CaseMonitorTUI:
         if self.last_update:
             header_text.append(f"Last Update: {self.last_update.strftime('%Y-%m-%d %H:%M:%S')}", style="dim")
         
-        next_update = self.refresh_seconds - (int(time.time()) % self.refresh_seconds)
+        if self.next_refresh is not None:
+            next_update = max(0, int(self.next_refresh - time.time()))
+        else:
+            next_update = self.refresh_seconds
         header_text.append(f" | Next refresh in: {next_update}s", style="dim")
         
         if self.error_message:
@@ -264,56 +661,62 @@ class CaseMonitorTUI:
         else:
             # Add ALL cases - no filtering
             for case in account.cases:
-                # Color code status
-                if case.status == "Waiting on Red Hat":
-                    status_style = "bold red"
-                else:
-                    status_style = "bold yellow"
-                
-                # Color code severity
-                severity_style = {
-                    "1 (Urgent)": "bold red",
-                    "2 (High)": "red",
-                    "3 (Normal)": "yellow",
-                    "4 (Low)": "green"
-                }.get(case.severity, "white")
-
-                # Color code creation date, format "2026-02-02T11:01:33.271Z"
-                # 1. Strip whitespace and parse the ISO format
-                # .replace('Z', '+00:00') ensures compatibility with older Python versions
-                dt_object = datetime.fromisoformat(case.created.strip().replace('Z', '+00:00'))
-
-                # 2. Get the current time in UTC
-                now = datetime.now(timezone.utc)
-
-                # 3. Create the if condition
-                creation_style = "white"
-                if now - dt_object > timedelta(weeks=1):
-                    creation_style = "yellow"
-                if now - dt_object > timedelta(weeks=4):
-                    creation_style = "red"
-                
-                table.add_row(
-                    f"[link={case.case_url}]{case.case_number}[/link]",
-                    case.summary or "",
-                    f"[{severity_style}]{case.severity}[/{severity_style}]",
-                    f"[{status_style}]{case.status}[/{status_style}]",
-                    case.product or "",
-                    f"[{creation_style}]{case.created[:10]}[/{creation_style}]",
-                    case.last_modified[:16] or ""
-                )
+                table.add_row(*self.render_case_row(case))
         
         return table
     
+    def render_case_row(self, case: Case) -> Tuple[str, ...]:
+        """Return the table cells for a case, memoized on the case"""
+        # Creation color depends on the case's age, so the memo only holds
+        # until the case crosses its next age threshold
+        now = datetime.now(timezone.utc)
+        if case._rendered is not None:
+            valid_until, row = case._rendered
+            if valid_until is None or now < valid_until:
+                return row
+        
+        status_style = _STATUS_STYLE.get(case.status, "bold yellow")
+        severity_style = _SEVERITY_STYLE.get(case.severity, "white")
+
+        # Color code creation date, format "2026-02-02T11:01:33.271Z"
+        # 1. Strip whitespace and parse the ISO format
+        # .replace('Z', '+00:00') ensures compatibility with older Python versions
+        dt_object = datetime.fromisoformat(case.created.strip().replace('Z', '+00:00'))
+
+        # 2. Create the if condition
+        creation_style = "white"
+        valid_until = dt_object + timedelta(weeks=1)
+        if now - dt_object > timedelta(weeks=1):
+            creation_style = "yellow"
+            valid_until = dt_object + timedelta(weeks=4)
+        if now - dt_object > timedelta(weeks=4):
+            creation_style = "red"
+            valid_until = None
+        
+        row = (
+            case.case_link,
+            case.summary or "",
+            f"[{severity_style}]{case.severity}[/{severity_style}]",
+            f"[{status_style}]{case.status}[/{status_style}]",
+            case.product or "",
+            f"[{creation_style}]{case.created[:10]}[/{creation_style}]",
+            case.last_modified[:16] or ""
+        )
+        # Case is frozen; the memo isn't part of its value
+        object.__setattr__(case, "_rendered", (valid_until, row))
+        return row
+    
+    def summary_totals(self) -> Tuple[int, int]:
+        """Return (total cases, cases waiting on Red Hat) across all accounts"""
+        total_cases = waiting_on_rh = 0
+        for acc in self.accounts:
+            total_cases += acc.total_cases
+            waiting_on_rh += acc.waiting_on_rh
+        return total_cases, waiting_on_rh
+    
     def create_summary_panel(self) -> Panel:
         """Create a summary statistics panel"""
-        # Use (acc.cases or []) to ensure len() always receives a list
-        total_cases = sum(len(acc.cases or []) for acc in self.accounts)
-        
-        waiting_on_rh = sum(
-            len([c for c in (acc.cases or []) if c.status == "Waiting on Red Hat"]) 
-            for acc in self.accounts
-        )
+        total_cases, waiting_on_rh = self.summary_totals()
         waiting_on_customer = total_cases - waiting_on_rh
         
         summary_text = Text()
@@ -349,52 +752,95 @@ class CaseMonitorTUI:
             Layout(name="footer", size=3)
         )
         
-        # Add header
-        layout["header"].update(self.create_header())
-        
-        # Add summary
-        layout["summary"].update(self.create_summary_panel())
+        # Add header; rebuilt on each Live refresh to keep the countdown current
+        layout["header"].update(LiveHeader(self))
         
         # Add footer
         layout["footer"].update(self.create_footer())
         
-        # Add account tables
-        if self.accounts:
+        self.layout = layout
+        self._summary_totals = None
+        self._account_tables = {}
+        self.update_body()
+        
+        return layout
+    
+    def update_body(self):
+        """Refresh the summary and account tables after a fetch"""
+        # Summary only changes when the totals do
+        totals = self.summary_totals()
+        if totals != self._summary_totals:
+            self.layout["summary"].update(self.create_summary_panel())
+            self._summary_totals = totals
+        
+        if not self.accounts:
+            return
+        
+        # Only rebuild tables whose case list was replaced (cache hits hand
+        # back the same list object) or where a case crossed an age threshold
+        now = datetime.now(timezone.utc)
+        changed = False
+        for account in self.accounts:
+            entry = self._account_tables.get(account.id)
+            if entry is None or entry[0] is not account.cases or (entry[2] is not None and now >= entry[2]):
+                table = self.create_account_table(account)
+                expiries = [case._rendered[0] for case in account.cases if case._rendered[0] is not None]
+                self._account_tables[account.id] = (account.cases, table, min(expiries, default=None))
+                changed = True
+        
+        if changed:
             # Create a simple group of tables instead of nested layouts
             tables = []
             for account in self.accounts:
-                tables.append(self.create_account_table(account))
+                tables.append(self._account_tables[account.id][1])
                 # Add spacing between tables
                 tables.append(Text(""))
             
-            layout["body"].update(Group(*tables))
-        
-        return layout
+            self.layout["body"].update(Group(*tables))
     
     def run(self):
             """Run the TUI application"""
+            input_thread = None
             try:
                 self.accounts = self.load_accounts()
                 self.console.print("[bold cyan]Initializing...[/bold cyan]")
                 self.fetch_all_cases()
                 
                 # Start the keyboard listener in a background thread
-                input_thread = threading.Thread(target=self.keyboard_listener, daemon=True)
+                input_thread = threading.Thread(target=self.keyboard_listener)
                 input_thread.start()
 
-                with Live(self.create_layout(), console=self.console, refresh_per_second=2) as live:
-                    last_fetch = time.time()
+                # Built once; Live re-renders it in place as its regions are updated
+                layout = self.create_layout()
+                # Redraw only on ticks and fetches; each redraw renders every
+                # account table, so auto-refresh would do that once a second
+                with Live(layout, console=self.console, auto_refresh=False) as live:
+                    self.next_refresh = time.time() + self.refresh_seconds
                     while self.running:
-                        current_time = time.time()
-                        if current_time - last_fetch >= self.refresh_seconds:
-                            self.fetch_all_cases()
-                            last_fetch = current_time
+                        # Sleep until the next countdown tick, scheduled fetch or quit key
+                        remaining = self.next_refresh - time.time()
+                        self._wake.wait(timeout=max(0.0, min(remaining, self.COUNTDOWN_TICK)))
+                        if not self.running:
+                            break
                         
-                        live.update(self.create_layout())
-                        time.sleep(0.2) # Faster response time
+                        if time.time() >= self.next_refresh:
+                            self.fetch_all_cases()
+                            self.update_body()
+                            self.next_refresh = time.time() + self.refresh_seconds
+                        live.refresh()
             except KeyboardInterrupt:
                 pass
             finally:
+                # Stop the listener so it restores the terminal settings
+                self.running = False
+                if input_thread:
+                    input_thread.join()
+                # Close idle connections before dropping queued fetches; a
+                # request already in flight can still run for up to one
+                # REQUEST_TIMEOUT, as reads are never retried
+                self.api.close()
+                if self.executor:
+                    self.executor.shutdown(wait=False, cancel_futures=True)
                 self.console.print("\n[bold yellow]Exiting...[/bold yellow]")
 
 def main():